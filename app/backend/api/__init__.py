@@ -4,6 +4,7 @@ from .posts import posts_bp
 from .feed import feed_bp
 from .jobs import jobs_bp
 from .messaging import messaging_bp
+from .notifications import notifications_bp
 
 __all__ = [
     'auth_bp',
@@ -11,5 +12,6 @@ __all__ = [
     'posts_bp',
     'feed_bp',
     'jobs_bp',
-    'messaging_bp'
+    'messaging_bp',
+    'notifications_bp'
 ] 
\ No newline at end of file
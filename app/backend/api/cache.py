@@ -0,0 +1,82 @@
+from flask import request, current_app, make_response
+from functools import wraps
+from collections import OrderedDict
+import threading
+
+# Serialized responses keyed by (path with query string, etag). The etag changes whenever the
+# underlying row's version is bumped, so stale entries are never served and
+# simply fall off the end of the LRU.
+_response_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _with_validators(response, version_tag):
+    """Attach the ETag and revalidation headers to a response"""
+    response.set_etag(version_tag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Authorization')
+    return response
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            _response_cache.move_to_end(key)
+        return entry
+
+def _cache_put(key, entry):
+    max_size = current_app.config.get('RESPONSE_CACHE_SIZE', 1024)
+    with _cache_lock:
+        _response_cache[key] = entry
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > max_size:
+            _response_cache.popitem(last=False)
+
+def clear_response_cache():
+    """Drop every cached response"""
+    with _cache_lock:
+        _response_cache.clear()
+
+def cached_response(version_loader):
+    """Serve a read endpoint conditionally using a cheap version lookup.
+
+    ``version_loader`` receives the view arguments and returns a version tag
+    string (e.g. ``profile-3-7``) or ``None`` when no version is known yet.
+    The cache is shared by every caller of a URL, so the tag must be scoped
+    to the identity the body was built for (the profile tag embeds the JWT
+    user id); two users must never get the same tag for different bodies.
+    Views should set their own ETag from the row they serialized; that tag
+    takes precedence when the body is cached.
+    When the client's ``If-None-Match`` matches, a 304 is returned without
+    running the view. Otherwise a previously serialized body for the same
+    version is reused, and only on a miss is the view executed.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version_tag = version_loader(**kwargs)
+            if version_tag is None:
+                return view(*args, **kwargs)
+
+            if request.if_none_match.contains_weak(version_tag):
+                return _with_validators(make_response('', 304), version_tag)
+
+            key = (request.full_path, version_tag)
+            entry = _cache_get(key)
+            if entry is not None:
+                body, status, mimetype = entry
+                response = current_app.response_class(body, status=status, mimetype=mimetype)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                # A write may have landed between the lookup and the view; the
+                # view's own ETag names the version the body was built from
+                served_tag, _ = response.get_etag()
+                if served_tag:
+                    version_tag = served_tag
+                    key = (request.full_path, version_tag)
+                _cache_put(key, (response.get_data(), response.status_code, response.mimetype))
+
+            return _with_validators(response, version_tag)
+        return wrapper
+    return decorator
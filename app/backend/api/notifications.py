@@ -0,0 +1,79 @@
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from models.user import db
+from models.notification import (
+    NotificationCounter, list_notifications, mark_read, mark_all_read, actor_names
+)
+
+notifications_bp = Blueprint('notifications', __name__)
+
+@notifications_bp.route('/api/notifications', methods=['GET'])
+@jwt_required()
+def get_notifications():
+    """List aggregated notifications, newest first, one keyset page at a time"""
+    try:
+        user_id = int(get_jwt_identity())
+        page_size = current_app.config['NOTIFICATION_PAGE_SIZE']
+        limit = min(request.args.get('limit', page_size, type=int), current_app.config['NOTIFICATION_MAX_PAGE_SIZE'])
+        if limit < 1:
+            return jsonify({'error': 'Limit must be positive'}), 400
+
+        try:
+            page, next_cursor = list_notifications(user_id, limit, request.args.get('cursor'))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+        names = actor_names(page)
+        return jsonify({
+            'notifications': [n.to_dict(names.get(n.actor_id)) for n in page],
+            'next_cursor': next_cursor,
+            'unread_count': NotificationCounter.get_unread(user_id)
+        }), 200
+    except ValueError:
+        return jsonify({'error': 'Invalid user ID format'}), 400
+    except Exception as e:
+        current_app.logger.error(f"Error listing notifications: {str(e)}")
+        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+
+@notifications_bp.route('/api/notifications/unread-count', methods=['GET'])
+@jwt_required()
+def get_unread_count():
+    """Badge count, read from the materialized counter"""
+    try:
+        user_id = int(get_jwt_identity())
+        return jsonify({'unread_count': NotificationCounter.get_unread(user_id)}), 200
+    except ValueError:
+        return jsonify({'error': 'Invalid user ID format'}), 400
+
+@notifications_bp.route('/api/notifications/<int:notification_id>/read', methods=['POST'])
+@jwt_required()
+def read_notification(notification_id):
+    """Mark a single notification as read"""
+    try:
+        user_id = int(get_jwt_identity())
+        if not mark_read(user_id, notification_id):
+            return jsonify({'error': 'Notification not found'}), 404
+        db.session.commit()
+        return jsonify({'unread_count': NotificationCounter.get_unread(user_id)}), 200
+    except ValueError:
+        return jsonify({'error': 'Invalid user ID format'}), 400
+    except Exception as e:
+        current_app.logger.error(f"Error marking notification read: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+
+@notifications_bp.route('/api/notifications/read-all', methods=['POST'])
+@jwt_required()
+def read_all_notifications():
+    """Mark every notification as read"""
+    try:
+        user_id = int(get_jwt_identity())
+        mark_all_read(user_id)
+        db.session.commit()
+        return jsonify({'unread_count': 0}), 200
+    except ValueError:
+        return jsonify({'error': 'Invalid user ID format'}), 400
+    except Exception as e:
+        current_app.logger.error(f"Error marking notifications read: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
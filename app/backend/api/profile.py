@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 from models.user import User
 from models.profile import Profile, db
+from api.cache import cached_response
 import os
 import uuid
 from flask import current_app
@@ -11,8 +12,17 @@ import json
 
 profile_bp = Blueprint('profile', __name__)
 
+def current_profile_version():
+    """Cheap version lookup for the authenticated user's profile"""
+    try:
+        return Profile.current_version_tag(int(get_jwt_identity()))
+    except ValueError:
+        # Let the view report the invalid identity
+        return None
+
 @profile_bp.route('/api/profile', methods=['GET'])
 @jwt_required()
+@cached_response(current_profile_version)
 def get_profile():
     """Get user profile data"""
     try:
@@ -33,14 +43,17 @@ def get_profile():
             db.session.add(profile)
             db.session.commit()
         
-        return jsonify({
+        response = jsonify({
             'profile': user.profile.to_dict(),
             'user': {
                 'id': user.id,
                 'username': user.username,
                 'email': user.email
             }
-        }), 200
+        })
+        # Tag the body with the version it was actually built from
+        response.set_etag(Profile.make_version_tag(user.id, user.profile.version), weak=True)
+        return response, 200
     except ValueError:
         current_app.logger.error(f"Invalid user ID format: {user_id_str}")
         return jsonify({'error': 'Invalid user ID format'}), 400
@@ -104,6 +117,7 @@ def update_profile():
         if not updated:
             return jsonify({'error': 'No valid fields to update'}), 400
         
+        profile.touch()
         db.session.commit()
         current_app.logger.info(f"Profile updated successfully for user_id: {user_id}")
         return jsonify({'profile': profile.to_dict()}), 200
@@ -189,6 +203,7 @@ def upload_profile_image():
             db.session.add(user.profile)
         
         user.profile.image_url = f"/uploads/{filename}"
+        user.profile.touch()
         db.session.commit()
         
         current_app.logger.info(f"Image uploaded successfully for user_id: {user_id}")
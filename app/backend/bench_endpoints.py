@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the auth and profile endpoints.
+
+Start the server first (e.g. `python main.py`), then run:
+
+    python bench_endpoints.py --base-url http://localhost:5000 --requests 200
+
+For each concurrency level it reports throughput and latency percentiles,
+so runs against different builds or server setups can be compared.
+Connection failures and timeouts are counted as errors.
+
+Each run signs up a throwaway bench_<random> user unless --username and
+--password name an existing account, and every profile_image request
+stores an upload (original plus thumbnail) in UPLOAD_FOLDER. Run it
+against a development database and upload folder, or clean those up
+afterwards.
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib import request as urlrequest
+from urllib.error import HTTPError
+
+# Status reported for requests that never got an HTTP response
+NETWORK_ERROR = 599
+
+def call(method, url, body=None, headers=None, content_type='application/json'):
+    """Send one request and return (status, response body).
+
+    Failures below HTTP (refused or reset connections, timeouts) come back
+    as NETWORK_ERROR with the exception text as the body.
+    """
+    data = json.dumps(body).encode() if isinstance(body, dict) else body
+    req = urlrequest.Request(url, data=data, method=method, headers=dict(headers or {}))
+    if data is not None:
+        req.add_header('Content-Type', content_type)
+    try:
+        with urlrequest.urlopen(req, timeout=60) as resp:
+            return resp.status, resp.read()
+    except HTTPError as e:
+        return e.code, e.read()
+    except (OSError, http.client.HTTPException) as e:
+        # URLError, ConnectionResetError and socket timeouts are all OSErrors
+        return NETWORK_ERROR, str(e).encode()
+
+def multipart_image(size=(800, 800)):
+    """Build a multipart body with a JPEG, or None if Pillow is missing"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    img_io = BytesIO()
+    Image.new('RGB', size, color='red').save(img_io, 'JPEG')
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        'Content-Disposition: form-data; name="image"; filename="bench.jpg"\r\n'
+        'Content-Type: image/jpeg\r\n\r\n'
+    ).encode() + img_io.getvalue() + f'\r\n--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+def run_level(name, fn, concurrency, total):
+    """Fire ``total`` calls of ``fn`` with ``concurrency`` in flight"""
+    latencies = []
+    errors = 0
+
+    def timed(_):
+        start = time.perf_counter()
+        status = fn()
+        return status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for status, latency in pool.map(timed, range(total)):
+            latencies.append(latency)
+            if status >= 400:
+                errors += 1
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{name:<16} c={concurrency:<4} {total / elapsed:8.1f} req/s  "
+          f"p50={statistics.median(latencies) * 1000:7.1f}ms  p95={p95 * 1000:7.1f}ms  errors={errors}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://localhost:5000')
+    parser.add_argument('--requests', type=int, default=200, help='requests per concurrency level')
+    parser.add_argument('--concurrency', default='1,8,32,64', help='comma-separated levels')
+    parser.add_argument('--username', help='existing account to use instead of signing up a new one')
+    parser.add_argument('--password', help='password for --username')
+    args = parser.parse_args()
+    base = args.base_url
+
+    print("🏁 Benchmarking", base)
+    if args.username:
+        credentials = {'username': args.username, 'password': args.password or ''}
+    else:
+        unique_id = uuid.uuid4().hex[:8]
+        credentials = {'username': f'bench_{unique_id}', 'password': 'password123'}
+        status, _ = call('POST', f'{base}/api/signup', {**credentials, 'email': f'bench_{unique_id}@example.com'})
+        if status < 400:
+            print(f"👤 Created user {credentials['username']}")
+    status, body = call('POST', f'{base}/api/login', credentials)
+    if status != 200:
+        print(f"❌ Login failed ({status}): {body[:200]}")
+        return
+    auth = {'Authorization': f"Bearer {json.loads(body)['token']}"}
+    call('GET', f'{base}/api/profile', headers=auth)
+    image = multipart_image()
+
+    scenarios = {
+        'login': lambda: call('POST', f'{base}/api/login', credentials)[0],
+        'profile': lambda: call('GET', f'{base}/api/profile', headers=auth)[0],
+    }
+    if image:
+        scenarios['profile_image'] = lambda: call('POST', f'{base}/api/profile/image', image[0],
+                                                  headers=auth, content_type=image[1])[0]
+
+    for name, fn in scenarios.items():
+        for concurrency in (int(c) for c in args.concurrency.split(',')):
+            run_level(name, fn, concurrency, args.requests)
+
+if __name__ == '__main__':
+    main()
@@ -22,4 +22,13 @@ class Config:
     ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
     IMAGE_THUMBNAIL_SIZE = (128, 128)
     IMAGE_RESIZE_SIZE = (400, 400)
-    IMAGE_COMPRESS_QUALITY = 85
\ No newline at end of file
+    IMAGE_COMPRESS_QUALITY = 85
+    
+    # Response cache for conditional (ETag) reads
+    RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 1024))
+    
+    # Notifications
+    NOTIFICATION_AGGREGATION_WINDOW = timedelta(hours=24)  # Bursts within this window collapse into one entry
+    NOTIFICATION_PAGE_SIZE = 20
+    NOTIFICATION_MAX_PAGE_SIZE = 50
+    NOTIFICATION_DIGEST_BATCH_SIZE = int(os.environ.get('NOTIFICATION_DIGEST_BATCH_SIZE', 500))
\ No newline at end of file
@@ -1,11 +1,13 @@
 from flask import Flask, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
+from flask_migrate import Migrate, upgrade
 from flask_cors import CORS
 from config import Config
 from dotenv import load_dotenv
 from flask_jwt_extended import JWTManager
 from api.auth import auth_bp
 from api.profile import profile_bp
+from api.notifications import notifications_bp
 import os
 
 # Load environment variables
@@ -14,6 +16,10 @@ load_dotenv()
 # Import models
 from models.user import db, User
 from models.profile import Profile
+from models.post import Post, Comment, Like
+from models.job import Company, Job, JobApplication
+from models.message import Message
+from models.notification import Notification, NotificationCounter, build_digests
 
 # Create Flask app
 app = Flask(__name__)
@@ -23,6 +29,7 @@ app.config.from_object(Config)
 CORS(app)
 
 db.init_app(app)
+migrate = Migrate(app, db, directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations'))
 
 # Initialize JWT with proper configuration
 jwt = JWTManager(app)
@@ -30,6 +37,7 @@ jwt = JWTManager(app)
 # Register blueprints
 app.register_blueprint(auth_bp)
 app.register_blueprint(profile_bp)
+app.register_blueprint(notifications_bp)
 
 # Serve uploaded files
 @app.route('/uploads/<filename>')
@@ -38,6 +46,16 @@ def uploaded_file(filename):
     upload_folder = app.config['UPLOAD_FOLDER']
     return send_from_directory(upload_folder, filename)
 
+@app.cli.command('send-digests')
+def send_digests():
+    """Build notification digests; meant to be run from cron"""
+    def deliver(user_id, digest):
+        # No mail transport yet, so digests go to the application log
+        app.logger.info(f"Digest for user_id {user_id}: {digest}")
+
+    count = build_digests(deliver)
+    print(f"✅ Sent {count} notification digests")
+
 def setup_database():
     """Setup database tables"""
     with app.app_context():
@@ -45,9 +63,9 @@ def setup_database():
         upload_folder = app.config['UPLOAD_FOLDER']
         os.makedirs(upload_folder, exist_ok=True)
         
-        # Create database tables
-        db.create_all()
-        print("✅ Database tables created successfully!")
+        # Apply schema migrations (see migrations/versions)
+        upgrade()
+        print("✅ Database migrations applied successfully!")
         print(f"✅ Upload folder created: {upload_folder}")
         print(f"✅ JWT Secret Key: {app.config.get('JWT_SECRET_KEY', 'Not set')}")
 
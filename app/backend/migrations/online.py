@@ -0,0 +1,173 @@
+"""Schema-change helpers that are safe to run against large, live tables.
+
+Every helper is idempotent so an interrupted upgrade can simply be re-run:
+MySQL DDL is not transactional, so a failure half way through a revision
+leaves the earlier statements applied.
+"""
+from alembic import op
+from sqlalchemy.schema import CreateColumn
+import sqlalchemy as sa
+
+# Bookkeeping table listing the pre-existing indexes each revision dropped,
+# so its downgrade can restore exactly those. Not part of the models.
+DROPPED_INDEXES_TABLE = 'alembic_dropped_indexes'
+
+
+def _dialect():
+    return op.get_bind().dialect.name
+
+
+def table_exists(table):
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def column_exists(table, column):
+    return column in {c['name'] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def index_exists(table, name):
+    return name in {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def create_table_if_missing(table, *columns, **kwargs):
+    """Create a table unless it already exists (e.g. loaded from db.sql)"""
+    if not table_exists(table):
+        op.create_table(table, *columns, **kwargs)
+
+
+def add_column_online(table, column):
+    """Add a column without rewriting the table.
+
+    The column must be nullable or carry a server default so that MySQL 8
+    can add it with ALGORITHM=INSTANT and PostgreSQL as a catalog-only change.
+    On MySQL the algorithm is requested explicitly, so an add that would
+    rebuild the table fails instead of silently locking it.
+    SQLite cannot add NOT NULL columns with expression defaults, so there the
+    table is copied instead; SQLite is only used for local development.
+    """
+    if column_exists(table, column.name):
+        return
+    if not column.nullable and column.server_default is None:
+        raise ValueError(f"{table}.{column.name} needs a server default to be added online")
+    dialect = _dialect()
+    if dialect == 'mysql':
+        ddl = CreateColumn(column).compile(dialect=op.get_bind().dialect)
+        op.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}, ALGORITHM=INSTANT")
+    elif dialect == 'sqlite':
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(column)
+    else:
+        op.add_column(table, column)
+
+
+def create_index_online(name, table, columns, unique=False):
+    """Build an index while the table keeps accepting reads and writes"""
+    if index_exists(table, name):
+        return
+    dialect = _dialect()
+    if dialect == 'mysql':
+        # InnoDB online DDL: in-place build, concurrent DML allowed
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} "
+            f"({', '.join(columns)}) ALGORITHM=INPLACE LOCK=NONE"
+        )
+    elif dialect == 'postgresql':
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def drop_index_online(name, table):
+    """Drop an index without blocking writes"""
+    if not table_exists(table) or not index_exists(table, name):
+        return
+    dialect = _dialect()
+    if dialect == 'mysql':
+        op.execute(f"DROP INDEX {name} ON {table} ALGORITHM=INPLACE LOCK=NONE")
+    elif dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
+
+
+def drop_existing_index_online(revision, name, table):
+    """Drop an index that predates the migrations, remembering that we did.
+
+    Databases loaded from the original db.sql carry indexes that ones built
+    from the migrations never had. The drop is recorded first, so an
+    interrupted upgrade still leaves the record for the downgrade.
+    """
+    if not table_exists(table) or not index_exists(table, name):
+        return
+    create_table_if_missing(
+        DROPPED_INDEXES_TABLE,
+        sa.Column('revision', sa.String(length=64), primary_key=True),
+        sa.Column('index_name', sa.String(length=128), primary_key=True)
+    )
+    bind = op.get_bind()
+    params = {'revision': revision, 'index_name': name}
+    recorded = bind.execute(sa.text(
+        f"SELECT 1 FROM {DROPPED_INDEXES_TABLE} WHERE revision = :revision AND index_name = :index_name"
+    ), params).first()
+    if not recorded:
+        bind.execute(sa.text(
+            f"INSERT INTO {DROPPED_INDEXES_TABLE} (revision, index_name) VALUES (:revision, :index_name)"
+        ), params)
+    drop_index_online(name, table)
+
+
+def dropped_indexes(revision):
+    """Names of the pre-existing indexes ``revision`` dropped on this database"""
+    if not table_exists(DROPPED_INDEXES_TABLE):
+        return set()
+    rows = op.get_bind().execute(sa.text(
+        f"SELECT index_name FROM {DROPPED_INDEXES_TABLE} WHERE revision = :revision"
+    ), {'revision': revision})
+    return {row[0] for row in rows}
+
+
+def forget_dropped_indexes(revision):
+    """Clear the record once ``revision``'s downgrade has restored its indexes"""
+    if not table_exists(DROPPED_INDEXES_TABLE):
+        return
+    bind = op.get_bind()
+    bind.execute(sa.text(f"DELETE FROM {DROPPED_INDEXES_TABLE} WHERE revision = :revision"),
+                 {'revision': revision})
+    if not bind.execute(sa.text(f"SELECT 1 FROM {DROPPED_INDEXES_TABLE}")).first():
+        op.drop_table(DROPPED_INDEXES_TABLE)
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Keep the bookkeeping table out of autogenerate and drift checks"""
+    return not (type_ == 'table' and name == DROPPED_INDEXES_TABLE)
+
+
+def run_in_batches(statement, table, key='id', batch_size=1000):
+    """Run ``statement`` once per chunk of ``table.key`` values.
+
+    ``statement`` must bound its rows with ``:start < key <= :end``. The
+    chunks run outside the migration transaction and each one commits on
+    its own, so row locks are released after every chunk and replicas never
+    fall behind on one giant statement. It must also skip rows that are
+    already done so a re-run resumes cleanly.
+    """
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        max_key = bind.execute(sa.text(f"SELECT MAX({key}) FROM {table}")).scalar() or 0
+        for start in range(0, max_key, batch_size):
+            bind.execute(sa.text(statement), {'start': start, 'end': start + batch_size})
+
+
+def backfill_in_batches(table, assignments, where, batch_size=1000):
+    """Run ``UPDATE table SET assignments WHERE where`` in primary-key chunks.
+
+    The ``where`` clause must exclude rows that are already done.
+    """
+    run_in_batches(
+        f"UPDATE {table} SET {assignments} "
+        f"WHERE id > :start AND id <= :end AND ({where})",
+        table, batch_size=batch_size
+    )
@@ -0,0 +1,54 @@
+"""Baseline users and profiles tables
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+Databases that were set up with db.create_all() already have these tables;
+they are adopted as-is instead of being recreated.
+"""
+from alembic import op
+import sqlalchemy as sa
+from online import create_table_if_missing
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_baseline'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_table_if_missing(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=80), nullable=False),
+        sa.Column('email', sa.String(length=120), nullable=False),
+        sa.Column('password_hash', sa.String(length=256), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username'),
+        sa.UniqueConstraint('email'),
+    )
+    create_table_if_missing(
+        'profiles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('full_name', sa.String(length=120), nullable=False),
+        sa.Column('bio', sa.String(length=500), nullable=True),
+        sa.Column('location', sa.String(length=120), nullable=True),
+        sa.Column('headline', sa.String(length=120), nullable=True),
+        sa.Column('experience', sa.String(length=500), nullable=True),
+        sa.Column('education', sa.Text(), nullable=True),
+        sa.Column('skills', sa.String(length=500), nullable=True),
+        sa.Column('website', sa.String(length=120), nullable=True),
+        sa.Column('image_url', sa.String(length=256), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('profiles')
+    op.drop_table('users')
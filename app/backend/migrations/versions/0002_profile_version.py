@@ -0,0 +1,31 @@
+"""Profile version and updated_at for ETags
+
+Revision ID: 0002_profile_version
+Revises: 0001_baseline
+Create Date: 2026-10-19 09:05:00.000000
+
+Both columns carry a server default so existing profiles start at
+version 1 without a table rewrite or a backfill pass.
+"""
+from alembic import op
+import sqlalchemy as sa
+from online import add_column_online
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_profile_version'
+down_revision = '0001_baseline'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_online('profiles', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+    add_column_online('profiles', sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                            server_default=sa.func.now()))
+
+
+def downgrade():
+    with op.batch_alter_table('profiles') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('version')
@@ -0,0 +1,34 @@
+"""User role and timestamps from db.sql
+
+Revision ID: 0003_user_role_and_timestamps
+Revises: 0002_profile_version
+Create Date: 2026-10-19 09:10:00.000000
+
+All columns carry a server default so existing rows are filled in by the
+database without a table rewrite or a backfill pass.
+"""
+from alembic import op
+import sqlalchemy as sa
+from online import add_column_online
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_user_role_and_timestamps'
+down_revision = '0002_profile_version'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_online('users', sa.Column('role', sa.String(length=20), nullable=False, server_default='user'))
+    add_column_online('users', sa.Column('created_at', sa.DateTime(), nullable=False,
+                                         server_default=sa.func.now()))
+    add_column_online('users', sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                         server_default=sa.func.now()))
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('created_at')
+        batch_op.drop_column('role')
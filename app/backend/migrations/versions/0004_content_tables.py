@@ -0,0 +1,145 @@
+"""Posts, comments, likes, companies, jobs, applications, messages, notifications
+
+Revision ID: 0004_content_tables
+Revises: 0003_user_role_and_timestamps
+Create Date: 2026-10-19 09:20:00.000000
+
+Tables that already exist because db.sql was loaded are left alone; their
+indexes are brought in line by 0005_hot_path_indexes.
+"""
+from alembic import op
+import sqlalchemy as sa
+from online import create_table_if_missing
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_content_tables'
+down_revision = '0003_user_role_and_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_table_if_missing(
+        'posts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('media_url', sa.String(length=256), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.CheckConstraint("status IN ('active', 'archived')", name='ck_posts_status'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'comments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'likes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'post_id', name='uq_likes_user_id_post_id'),
+    )
+    create_table_if_missing(
+        'companies',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=120), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('website', sa.String(length=120), nullable=True),
+        sa.Column('industry', sa.String(length=120), nullable=True),
+        sa.Column('company_size', sa.String(length=50), nullable=True),
+        sa.Column('location', sa.String(length=120), nullable=True),
+        sa.Column('logo', sa.String(length=256), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=120), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('location', sa.String(length=120), nullable=False),
+        sa.Column('job_type', sa.String(length=20), nullable=False),
+        sa.Column('salary_range', sa.String(length=50), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.CheckConstraint("job_type IN ('full-time', 'part-time', 'contract', 'internship')",
+                           name='ck_jobs_job_type'),
+        sa.CheckConstraint("status IN ('open', 'closed')", name='ck_jobs_status'),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'job_applications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('applicant_name', sa.String(length=120), nullable=False),
+        sa.Column('applicant_email', sa.String(length=120), nullable=False),
+        sa.Column('resume_link', sa.String(length=256), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.CheckConstraint("status IN ('pending', 'reviewed', 'accepted', 'rejected')",
+                           name='ck_job_applications_status'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sender_id', sa.Integer(), nullable=False),
+        sa.Column('recipient_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('is_read', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['recipient_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['sender_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    create_table_if_missing(
+        'notifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.String(length=20), nullable=False),
+        sa.Column('reference_id', sa.Integer(), nullable=False),
+        sa.Column('is_read', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.CheckConstraint("type IN ('connection', 'message', 'like', 'comment', 'job_application')",
+                           name='ck_notifications_type'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('notifications')
+    op.drop_table('messages')
+    op.drop_table('job_applications')
+    op.drop_table('jobs')
+    op.drop_table('companies')
+    op.drop_table('likes')
+    op.drop_table('comments')
+    op.drop_table('posts')
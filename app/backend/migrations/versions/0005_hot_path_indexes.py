@@ -0,0 +1,75 @@
+"""Curated secondary indexes for the hot access paths
+
+Revision ID: 0005_hot_path_indexes
+Revises: 0004_content_tables
+Create Date: 2026-10-19 09:30:00.000000
+
+New indexes are built online before the db.sql indexes they supersede are
+dropped, so every foreign key stays covered throughout. The same set is
+declared in the models' __table_args__ and listed in db.sql.
+
+Only databases loaded from the original db.sql have the superseded indexes;
+the ones actually dropped are recorded so the downgrade restores just those.
+"""
+from online import (
+    create_index_online, drop_index_online, drop_existing_index_online,
+    dropped_indexes, forget_dropped_indexes
+)
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_hot_path_indexes'
+down_revision = '0004_content_tables'
+branch_labels = None
+depends_on = None
+
+
+HOT_PATH_INDEXES = [
+    ('idx_posts_user_id_created_at', 'posts', ['user_id', 'created_at']),
+    ('idx_posts_status_created_at', 'posts', ['status', 'created_at']),
+    ('idx_comments_post_id_created_at', 'comments', ['post_id', 'created_at']),
+    ('idx_comments_user_id', 'comments', ['user_id']),
+    ('idx_likes_post_id_created_at', 'likes', ['post_id', 'created_at']),
+    ('idx_companies_user_id', 'companies', ['user_id']),
+    ('idx_jobs_status_created_at', 'jobs', ['status', 'created_at']),
+    ('idx_jobs_company_id_status', 'jobs', ['company_id', 'status']),
+    ('idx_job_applications_job_id_status', 'job_applications', ['job_id', 'status']),
+    ('idx_job_applications_user_id_created_at', 'job_applications', ['user_id', 'created_at']),
+    ('idx_messages_sender_id_recipient_id_created_at', 'messages', ['sender_id', 'recipient_id', 'created_at']),
+    ('idx_messages_recipient_id_is_read_created_at', 'messages', ['recipient_id', 'is_read', 'created_at']),
+    ('idx_notifications_user_id_is_read_created_at', 'notifications', ['user_id', 'is_read', 'created_at']),
+]
+
+# Indexes from the original db.sql that are either a prefix of one of the
+# above or duplicate a UNIQUE constraint
+SUPERSEDED_INDEXES = [
+    ('idx_users_username', 'users', ['username']),
+    ('idx_users_email', 'users', ['email']),
+    ('idx_posts_user_id', 'posts', ['user_id']),
+    ('idx_posts_created_at', 'posts', ['created_at']),
+    ('idx_comments_post_id', 'comments', ['post_id']),
+    ('idx_likes_post_id', 'likes', ['post_id']),
+    ('idx_jobs_company_id', 'jobs', ['company_id']),
+    ('idx_jobs_status', 'jobs', ['status']),
+    ('idx_messages_sender_recipient', 'messages', ['sender_id', 'recipient_id']),
+    ('idx_notifications_user_id', 'notifications', ['user_id']),
+]
+
+
+def upgrade():
+    for name, table, columns in HOT_PATH_INDEXES:
+        create_index_online(name, table, columns)
+    for name, table, columns in SUPERSEDED_INDEXES:
+        drop_existing_index_online(revision, name, table)
+
+
+def downgrade():
+    # Restore the db.sql indexes this revision dropped first, so foreign keys
+    # stay covered while their composite replacements are dropped
+    dropped = dropped_indexes(revision)
+    for name, table, columns in SUPERSEDED_INDEXES:
+        if name in dropped:
+            create_index_online(name, table, columns)
+    for name, table, columns in reversed(HOT_PATH_INDEXES):
+        drop_index_online(name, table)
+    forget_dropped_indexes(revision)
@@ -0,0 +1,91 @@
+"""Notification aggregation columns, unread counters and list indexes
+
+Revision ID: 0006_notification_aggregation
+Revises: 0005_hot_path_indexes
+Create Date: 2026-10-19 10:00:00.000000
+
+Existing rows become single-actor entries whose updated_at is their
+created_at. The unread counters are seeded in user_id chunks and the
+actor rows in notification id chunks, each committed on its own. Every
+seed skips rows that already exist, so the revision can be re-run after a
+partial upgrade.
+"""
+from alembic import op
+import sqlalchemy as sa
+from online import (
+    add_column_online, backfill_in_batches, create_index_online,
+    create_table_if_missing, drop_index_online, run_in_batches
+)
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_notification_aggregation'
+down_revision = '0005_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_online('notifications', sa.Column('actor_id', sa.Integer(), nullable=True))
+    add_column_online('notifications', sa.Column('actor_count', sa.Integer(), nullable=False,
+                                                 server_default='1'))
+    add_column_online('notifications', sa.Column('updated_at', sa.DateTime(), nullable=False,
+                                                 server_default=sa.func.now()))
+    add_column_online('notifications', sa.Column('digested_at', sa.DateTime(), nullable=True))
+    backfill_in_batches('notifications', 'updated_at = created_at', 'updated_at <> created_at')
+
+    create_index_online('idx_notifications_user_id_type_reference_id_is_read', 'notifications',
+                        ['user_id', 'type', 'reference_id', 'is_read'])
+    create_index_online('idx_notifications_user_id_updated_at_id', 'notifications',
+                        ['user_id', 'updated_at', 'id'])
+    create_index_online('idx_notifications_digested_at_user_id', 'notifications',
+                        ['digested_at', 'user_id'])
+    # Unread badges now come from notification_counters
+    drop_index_online('idx_notifications_user_id_is_read_created_at', 'notifications')
+
+    create_table_if_missing(
+        'notification_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('unread_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    # Chunked by user so each user's count is taken in a single statement
+    run_in_batches(
+        "INSERT INTO notification_counters (user_id, unread_count) "
+        "SELECT n.user_id, COUNT(*) FROM notifications n "
+        "WHERE n.user_id > :start AND n.user_id <= :end AND NOT n.is_read AND NOT EXISTS "
+        "(SELECT 1 FROM notification_counters c WHERE c.user_id = n.user_id) "
+        "GROUP BY n.user_id",
+        'notifications', key='user_id'
+    )
+
+    create_table_if_missing(
+        'notification_actors',
+        sa.Column('notification_id', sa.Integer(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['notification_id'], ['notifications.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('notification_id', 'actor_id'),
+    )
+    run_in_batches(
+        "INSERT INTO notification_actors (notification_id, actor_id) "
+        "SELECT n.id, n.actor_id FROM notifications n "
+        "WHERE n.id > :start AND n.id <= :end AND n.actor_id IS NOT NULL AND NOT EXISTS "
+        "(SELECT 1 FROM notification_actors a WHERE a.notification_id = n.id)",
+        'notifications'
+    )
+
+
+def downgrade():
+    op.drop_table('notification_actors')
+    op.drop_table('notification_counters')
+    create_index_online('idx_notifications_user_id_is_read_created_at', 'notifications',
+                        ['user_id', 'is_read', 'created_at'])
+    drop_index_online('idx_notifications_digested_at_user_id', 'notifications')
+    drop_index_online('idx_notifications_user_id_updated_at_id', 'notifications')
+    drop_index_online('idx_notifications_user_id_type_reference_id_is_read', 'notifications')
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.drop_column('digested_at')
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('actor_count')
+        batch_op.drop_column('actor_id')
@@ -0,0 +1,104 @@
+from .user import db
+from datetime import datetime
+
+class Company(db.Model):
+    __tablename__ = 'companies'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    name = db.Column(db.String(120), nullable=False)
+    description = db.Column(db.Text)
+    website = db.Column(db.String(120))
+    industry = db.Column(db.String(120))
+    company_size = db.Column(db.String(50))
+    location = db.Column(db.String(120))
+    logo = db.Column(db.String(256))
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_companies_user_id', 'user_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'name': self.name,
+            'description': self.description,
+            'website': self.website,
+            'industry': self.industry,
+            'company_size': self.company_size,
+            'location': self.location,
+            'logo': self.logo
+        }
+
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.id', ondelete='CASCADE'), nullable=False)
+    title = db.Column(db.String(120), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    location = db.Column(db.String(120), nullable=False)
+    job_type = db.Column(db.String(20), nullable=False)  # full-time | part-time | contract | internship
+    salary_range = db.Column(db.String(50))
+    status = db.Column(db.String(20), nullable=False, default='open')  # open | closed
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    company = db.relationship('Company', backref='jobs')
+
+    __table_args__ = (
+        db.CheckConstraint("job_type IN ('full-time', 'part-time', 'contract', 'internship')", name='ck_jobs_job_type'),
+        db.CheckConstraint("status IN ('open', 'closed')", name='ck_jobs_status'),
+        # The job board: open jobs, newest first
+        db.Index('idx_jobs_status_created_at', 'status', 'created_at'),
+        # A company's postings
+        db.Index('idx_jobs_company_id_status', 'company_id', 'status'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'company_id': self.company_id,
+            'title': self.title,
+            'description': self.description,
+            'location': self.location,
+            'job_type': self.job_type,
+            'salary_range': self.salary_range,
+            'status': self.status,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class JobApplication(db.Model):
+    __tablename__ = 'job_applications'
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    applicant_name = db.Column(db.String(120), nullable=False)
+    applicant_email = db.Column(db.String(120), nullable=False)
+    resume_link = db.Column(db.String(256))
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending | reviewed | accepted | rejected
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.CheckConstraint("status IN ('pending', 'reviewed', 'accepted', 'rejected')", name='ck_job_applications_status'),
+        # Applications for a job, filtered by review status
+        db.Index('idx_job_applications_job_id_status', 'job_id', 'status'),
+        # A user's own applications, newest first
+        db.Index('idx_job_applications_user_id_created_at', 'user_id', 'created_at'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'job_id': self.job_id,
+            'user_id': self.user_id,
+            'applicant_name': self.applicant_name,
+            'applicant_email': self.applicant_email,
+            'resume_link': self.resume_link,
+            'status': self.status,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -0,0 +1,281 @@
+from .user import db, User
+from flask import current_app
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from datetime import datetime
+
+# Verb phrases used to render aggregated entries
+NOTIFICATION_VERBS = {
+    'connection': 'sent you a connection request',
+    'message': 'sent you a message',
+    'like': 'liked your post',
+    'comment': 'commented on your post',
+    'job_application': 'applied to your job'
+}
+
+class Notification(db.Model):
+    """One aggregated entry per (user, type, reference) burst.
+
+    A new event for the same type and reference is folded into the user's
+    unread entry as long as it was touched within the aggregation window;
+    otherwise a fresh entry is started.
+    """
+    __tablename__ = 'notifications'
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    type = db.Column(db.String(20), nullable=False)  # connection | message | like | comment | job_application
+    reference_id = db.Column(db.Integer, nullable=False)
+    actor_id = db.Column(db.Integer)  # Most recent user behind the event
+    actor_count = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    is_read = db.Column(db.Boolean, nullable=False, default=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, server_default=db.func.now())
+    digested_at = db.Column(db.DateTime)  # Set once included in a digest
+
+    __table_args__ = (
+        db.CheckConstraint(
+            "type IN ('connection', 'message', 'like', 'comment', 'job_application')",
+            name='ck_notifications_type'),
+        # Finding the open entry to fold a new event into
+        db.Index('idx_notifications_user_id_type_reference_id_is_read',
+                 'user_id', 'type', 'reference_id', 'is_read'),
+        # Keyset-paginated notification list, most recently touched first
+        db.Index('idx_notifications_user_id_updated_at_id', 'user_id', 'updated_at', 'id'),
+        # Digest builder walking users with undigested entries
+        db.Index('idx_notifications_digested_at_user_id', 'digested_at', 'user_id'),
+    )
+
+    def summary(self, actor_name=None):
+        """Render e.g. "Alice and 12 others liked your post" """
+        actor_name = actor_name or 'Someone'
+        verb = NOTIFICATION_VERBS.get(self.type, self.type)
+        others = (self.actor_count or 1) - 1
+        if others == 0:
+            return f"{actor_name} {verb}"
+        return f"{actor_name} and {others} {'other' if others == 1 else 'others'} {verb}"
+
+    def to_dict(self, actor_name=None):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'type': self.type,
+            'reference_id': self.reference_id,
+            'actor_id': self.actor_id,
+            'actor_count': self.actor_count,
+            'summary': self.summary(actor_name),
+            'is_read': self.is_read,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class NotificationActor(db.Model):
+    """Distinct users folded into an aggregated entry; the key dedupes repeats"""
+    __tablename__ = 'notification_actors'
+    notification_id = db.Column(db.Integer, db.ForeignKey('notifications.id', ondelete='CASCADE'),
+                                primary_key=True)
+    actor_id = db.Column(db.Integer, primary_key=True)
+
+    @staticmethod
+    def add(notification_id, actor_id):
+        """Record an actor; returns True only if they were not already counted"""
+        stmt = _insert(NotificationActor).values(notification_id=notification_id, actor_id=actor_id)
+        if _dialect() == 'mysql':
+            stmt = stmt.prefix_with('IGNORE')
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+        return db.session.execute(stmt).rowcount == 1
+
+class NotificationCounter(db.Model):
+    """Materialized unread count per user, so badges never scan notifications"""
+    __tablename__ = 'notification_counters'
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    unread_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    @staticmethod
+    def get_unread(user_id):
+        count = db.session.query(NotificationCounter.unread_count).filter_by(user_id=user_id).scalar()
+        return count or 0
+
+    @staticmethod
+    def adjust(user_id, delta):
+        """Atomically add ``delta`` to a user's unread count (never below zero).
+
+        A single upsert, so the first event for a user cannot race another
+        writer into a duplicate key.
+        """
+        new_count = db.case(
+            (NotificationCounter.unread_count + delta < 0, 0),
+            else_=NotificationCounter.unread_count + delta)
+        stmt = _insert(NotificationCounter).values(user_id=user_id, unread_count=max(delta, 0))
+        if _dialect() == 'mysql':
+            stmt = stmt.on_duplicate_key_update(unread_count=new_count)
+        else:
+            stmt = stmt.on_conflict_do_update(index_elements=['user_id'], set_={'unread_count': new_count})
+        db.session.execute(stmt)
+
+    @staticmethod
+    def lock(user_id):
+        """Create the user's counter row if needed and hold its row lock.
+
+        notify() takes this before looking for an open entry, so concurrent
+        events for one user are serialized and cannot both start a new entry.
+        """
+        NotificationCounter.adjust(user_id, 0)
+        db.session.query(NotificationCounter.user_id).filter_by(user_id=user_id).with_for_update().one()
+
+    @staticmethod
+    def reset(user_id):
+        NotificationCounter.query.filter_by(user_id=user_id).update(
+            {'unread_count': 0}, synchronize_session=False)
+
+def _dialect():
+    return db.session.get_bind().dialect.name
+
+def _insert(model):
+    """Dialect-specific INSERT so upserts can be expressed"""
+    dialects = {'mysql': mysql, 'postgresql': postgresql, 'sqlite': sqlite}
+    return dialects[_dialect()].insert(model)
+
+def notify(user_id, type, reference_id, actor_id=None):
+    """Record an event, folding it into an open entry for the same reference.
+
+    The caller owns the transaction and must commit.
+    """
+    if type not in NOTIFICATION_VERBS:
+        raise ValueError(f"Unknown notification type: {type}")
+
+    NotificationCounter.lock(user_id)
+
+    now = datetime.utcnow()
+    window_start = now - current_app.config['NOTIFICATION_AGGREGATION_WINDOW']
+    notification = Notification.query.filter(
+        Notification.user_id == user_id,
+        Notification.type == type,
+        Notification.reference_id == reference_id,
+        Notification.is_read == False,
+        Notification.updated_at >= window_start
+    ).first()
+
+    if notification:
+        # Only actors not already folded into this entry count as someone new;
+        # the counter lock keeps this read-modify-write serialized
+        if actor_id is not None:
+            if NotificationActor.add(notification.id, actor_id):
+                notification.actor_count += 1
+            notification.actor_id = actor_id
+        notification.updated_at = now
+        notification.digested_at = None
+        return notification
+
+    notification = Notification(user_id=user_id, type=type, reference_id=reference_id,
+                                actor_id=actor_id, actor_count=1,
+                                created_at=now, updated_at=now)
+    db.session.add(notification)
+    db.session.flush()
+    if actor_id is not None:
+        NotificationActor.add(notification.id, actor_id)
+    NotificationCounter.adjust(user_id, 1)
+    return notification
+
+def mark_read(user_id, notification_id):
+    """Mark one entry read; returns False if it does not belong to the user.
+
+    Runs under the counter lock, like notify(), and only an update that
+    actually flips the entry from unread decrements the counter.
+    """
+    NotificationCounter.lock(user_id)
+    updated = Notification.query.filter_by(id=notification_id, user_id=user_id, is_read=False).update(
+        {'is_read': True}, synchronize_session=False)
+    if updated == 1:
+        NotificationCounter.adjust(user_id, -1)
+        return True
+    return db.session.query(Notification.id).filter_by(id=notification_id, user_id=user_id).first() is not None
+
+def mark_all_read(user_id):
+    """Mark every entry read; the counter lock keeps notify() from slipping in between"""
+    NotificationCounter.lock(user_id)
+    Notification.query.filter_by(user_id=user_id, is_read=False).update(
+        {'is_read': True}, synchronize_session=False)
+    NotificationCounter.reset(user_id)
+
+def actor_names(notifications):
+    """Look up actor usernames for a page of entries in one query"""
+    actor_ids = {n.actor_id for n in notifications if n.actor_id}
+    if not actor_ids:
+        return {}
+    rows = db.session.query(User.id, User.username).filter(User.id.in_(actor_ids)).all()
+    return dict(rows)
+
+def encode_cursor(notification):
+    return f"{notification.updated_at.isoformat()}_{notification.id}"
+
+def decode_cursor(cursor):
+    """Parse a cursor from encode_cursor; raises ValueError if malformed"""
+    timestamp, _, notification_id = cursor.rpartition('_')
+    return datetime.fromisoformat(timestamp), int(notification_id)
+
+def list_notifications(user_id, limit, cursor=None):
+    """Return one page of entries and the cursor for the next page.
+
+    Uses keyset pagination on (updated_at, id) so deep pages cost the same as
+    the first one.
+    """
+    query = Notification.query.filter(Notification.user_id == user_id)
+    if cursor:
+        updated_at, notification_id = decode_cursor(cursor)
+        query = query.filter(db.or_(
+            Notification.updated_at < updated_at,
+            db.and_(Notification.updated_at == updated_at, Notification.id < notification_id)
+        ))
+    rows = query.order_by(Notification.updated_at.desc(), Notification.id.desc()).limit(limit + 1).all()
+
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1]) if len(rows) > limit else None
+    return page, next_cursor
+
+def build_digests(deliver, batch_size=None):
+    """Hand every user with undigested unread entries a digest via ``deliver``.
+
+    Users are walked in ``user_id`` order, ``batch_size`` at a time, with one
+    query for the batch's entries, one for actor names and one update to mark
+    them digested. Returns the number of digests delivered.
+    """
+    batch_size = batch_size or current_app.config['NOTIFICATION_DIGEST_BATCH_SIZE']
+    delivered = 0
+    last_user_id = 0
+
+    while True:
+        user_ids = [row[0] for row in db.session.query(Notification.user_id).filter(
+            Notification.digested_at.is_(None),
+            Notification.user_id > last_user_id
+        ).distinct().order_by(Notification.user_id).limit(batch_size)]
+        if not user_ids:
+            break
+
+        entries = Notification.query.filter(
+            Notification.user_id.in_(user_ids),
+            Notification.digested_at.is_(None),
+            Notification.is_read == False
+        ).order_by(Notification.user_id, Notification.updated_at.desc()).all()
+        names = actor_names(entries)
+        counts = dict(db.session.query(NotificationCounter.user_id, NotificationCounter.unread_count)
+                      .filter(NotificationCounter.user_id.in_(user_ids)).all())
+
+        by_user = {}
+        for entry in entries:
+            by_user.setdefault(entry.user_id, []).append(entry)
+        for digest_user_id, user_entries in by_user.items():
+            deliver(digest_user_id, {
+                'unread_count': counts.get(digest_user_id, 0),
+                'items': [entry.summary(names.get(entry.actor_id)) for entry in user_entries]
+            })
+            delivered += 1
+
+        # Read entries in the batch are marked too so they are not revisited
+        Notification.query.filter(
+            Notification.user_id.in_(user_ids),
+            Notification.digested_at.is_(None)
+        ).update({'digested_at': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+        last_user_id = user_ids[-1]
+
+    return delivered
@@ -1,4 +1,6 @@
 from .user import db, User
+from sqlalchemy import inspect
+from datetime import datetime
 import json
 
 class Profile(db.Model):
@@ -14,6 +16,28 @@ class Profile(db.Model):
     skills = db.Column(db.String(500))  # Allow longer skill lists
     website = db.Column(db.String(120))
     image_url = db.Column(db.String(256))  # Store profile image URL
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')  # Bumped on every change, used for ETags
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, server_default=db.func.now())
+
+    def touch(self):
+        """Mark the profile as changed so cached copies are invalidated"""
+        if inspect(self).persistent:
+            # Increment in SQL so concurrent writers each get their own version;
+            # the committed value is reloaded on next access
+            self.version = Profile.version + 1
+        self.updated_at = datetime.utcnow()
+
+    @staticmethod
+    def make_version_tag(user_id, version):
+        return f"profile-{user_id}-{version}"
+
+    @staticmethod
+    def current_version_tag(user_id):
+        """Look up only the version column, without loading the full profile"""
+        version = db.session.query(Profile.version).filter_by(user_id=user_id).scalar()
+        if version is None:
+            return None
+        return Profile.make_version_tag(user_id, version)
 
     def to_dict(self):
         return {
@@ -27,5 +51,7 @@ class Profile(db.Model):
             'education': json.loads(self.education) if self.education else [],
             'skills': self.skills.split(',') if self.skills else [],
             'website': self.website,
-            'image_url': self.image_url
+            'image_url': self.image_url,
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
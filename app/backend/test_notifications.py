@@ -0,0 +1,224 @@
+import unittest
+import os
+import tempfile
+from datetime import datetime, timedelta
+from flask import Flask
+from flask_jwt_extended import JWTManager
+from sqlalchemy import text
+from config import Config
+from api.auth import auth_bp
+from api.notifications import notifications_bp
+from models.user import db, User
+from models.profile import Profile
+from models.notification import (
+    Notification, NotificationCounter, notify, mark_read, mark_all_read, build_digests
+)
+
+class NotificationTestCase(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment on a throwaway SQLite database"""
+        self.db_fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        self.app = Flask(__name__)
+        self.app.config.from_object(Config)
+        self.app.config['TESTING'] = True
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{self.db_path}'
+        db.init_app(self.app)
+        JWTManager(self.app)
+        self.app.register_blueprint(auth_bp)
+        self.app.register_blueprint(notifications_bp)
+        self.client = self.app.test_client()
+        
+        with self.app.app_context():
+            db.create_all()
+            
+            # Create a recipient and a few actors
+            users = [User(username=name, email=f'{name}@example.com')
+                     for name in ('owner', 'alice', 'bob', 'carol')]
+            for user in users:
+                user.set_password('password123')
+                db.session.add(user)
+            db.session.commit()
+            self.owner_id, self.alice_id, self.bob_id, self.carol_id = [u.id for u in users]
+            
+            response = self.client.post('/api/login',
+                json={'username': 'owner', 'password': 'password123'})
+            self.headers = {'Authorization': f'Bearer {response.json["token"]}'}
+
+    def tearDown(self):
+        """Clean up after tests"""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        os.close(self.db_fd)
+        os.remove(self.db_path)
+
+    def test_burst_collapses_into_one_entry(self):
+        """Test that likes on the same post fold into a single aggregated entry"""
+        with self.app.app_context():
+            for actor_id in (self.bob_id, self.carol_id, self.alice_id):
+                notify(self.owner_id, 'like', 42, actor_id=actor_id)
+            db.session.commit()
+            
+            entries = Notification.query.filter_by(user_id=self.owner_id).all()
+            self.assertEqual(len(entries), 1)
+            self.assertEqual(entries[0].actor_count, 3)
+            self.assertEqual(entries[0].summary('alice'), 'alice and 2 others liked your post')
+            self.assertEqual(NotificationCounter.get_unread(self.owner_id), 1)
+
+    def test_repeat_actor_not_counted_twice(self):
+        """Test that repeated events from the same actor don't inflate the count"""
+        with self.app.app_context():
+            notify(self.owner_id, 'message', 7, actor_id=self.alice_id)
+            notify(self.owner_id, 'message', 7, actor_id=self.alice_id)
+            db.session.commit()
+            
+            entry = Notification.query.filter_by(user_id=self.owner_id).one()
+            self.assertEqual(entry.summary('alice'), 'alice sent you a message')
+
+    def test_alternating_actors_counted_once(self):
+        """Test that actors coming back after someone else are not recounted"""
+        with self.app.app_context():
+            for actor_id in (self.alice_id, self.bob_id, self.alice_id, self.bob_id, self.alice_id):
+                notify(self.owner_id, 'comment', 3, actor_id=actor_id)
+            db.session.commit()
+            
+            entry = Notification.query.filter_by(user_id=self.owner_id).one()
+            self.assertEqual(entry.actor_count, 2)
+            self.assertEqual(entry.summary('alice'), 'alice and 1 other commented on your post')
+
+    def test_read_entry_starts_new_burst(self):
+        """Test that events after an entry was read create a fresh entry"""
+        with self.app.app_context():
+            notify(self.owner_id, 'comment', 1, actor_id=self.alice_id)
+            db.session.commit()
+        
+        entry_id = self.client.get('/api/notifications', headers=self.headers).json['notifications'][0]['id']
+        response = self.client.post(f'/api/notifications/{entry_id}/read', headers=self.headers)
+        self.assertEqual(response.json['unread_count'], 0)
+        
+        with self.app.app_context():
+            notify(self.owner_id, 'comment', 1, actor_id=self.bob_id)
+            db.session.commit()
+            
+            self.assertEqual(Notification.query.filter_by(user_id=self.owner_id).count(), 2)
+            self.assertEqual(NotificationCounter.get_unread(self.owner_id), 1)
+
+    def test_burst_outside_window_starts_new_entry(self):
+        """Test that an unread entry older than the window is not extended"""
+        with self.app.app_context():
+            entry = notify(self.owner_id, 'like', 1, actor_id=self.alice_id)
+            entry.updated_at = datetime.utcnow() - timedelta(days=2)
+            db.session.commit()
+            
+            notify(self.owner_id, 'like', 1, actor_id=self.bob_id)
+            db.session.commit()
+            
+            self.assertEqual(Notification.query.filter_by(user_id=self.owner_id).count(), 2)
+            self.assertEqual(NotificationCounter.get_unread(self.owner_id), 2)
+
+    def test_unread_count_and_read_all(self):
+        """Test the badge count endpoint and marking everything read"""
+        with self.app.app_context():
+            notify(self.owner_id, 'like', 1, actor_id=self.alice_id)
+            notify(self.owner_id, 'like', 2, actor_id=self.alice_id)
+            notify(self.owner_id, 'connection', self.bob_id, actor_id=self.bob_id)
+            db.session.commit()
+        
+        response = self.client.get('/api/notifications/unread-count', headers=self.headers)
+        self.assertEqual(response.json['unread_count'], 3)
+        
+        self.client.post('/api/notifications/read-all', headers=self.headers)
+        response = self.client.get('/api/notifications/unread-count', headers=self.headers)
+        self.assertEqual(response.json['unread_count'], 0)
+
+    def test_counter_after_read_interleavings(self):
+        """Test that the counter tracks unread entries across repeated and racing reads"""
+        with self.app.app_context():
+            first, second, _ = [notify(self.owner_id, 'like', post_id, actor_id=self.alice_id).id
+                                for post_id in (1, 2, 3)]
+            db.session.commit()
+
+        # Reading the same entry twice only decrements once
+        for _ in range(2):
+            response = self.client.post(f'/api/notifications/{first}/read', headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['unread_count'], 2)
+
+        with self.app.app_context():
+            # This session still holds the entry as unread while another
+            # request marks it read and commits
+            stale = db.session.get(Notification, second)
+            self.assertFalse(stale.is_read)
+            with db.engine.begin() as connection:
+                connection.execute(text("UPDATE notifications SET is_read = 1 WHERE id = :id"), {'id': second})
+                connection.execute(text(
+                    "UPDATE notification_counters SET unread_count = unread_count - 1 WHERE user_id = :id"),
+                    {'id': self.owner_id})
+
+            self.assertTrue(mark_read(self.owner_id, second))
+            db.session.commit()
+            self.assertEqual(NotificationCounter.get_unread(self.owner_id), 1)
+
+            mark_all_read(self.owner_id)
+            notify(self.owner_id, 'like', 3, actor_id=self.bob_id)
+            db.session.commit()
+            unread = Notification.query.filter_by(user_id=self.owner_id, is_read=False).count()
+            self.assertEqual(NotificationCounter.get_unread(self.owner_id), unread)
+            self.assertEqual(unread, 1)
+
+        self.client.post('/api/notifications/read-all', headers=self.headers)
+        response = self.client.get('/api/notifications/unread-count', headers=self.headers)
+        self.assertEqual(response.json['unread_count'], 0)
+
+    def test_keyset_pagination(self):
+        """Test that pages follow the cursor without gaps or duplicates"""
+        with self.app.app_context():
+            for reference_id in range(5):
+                notify(self.owner_id, 'like', reference_id, actor_id=self.alice_id)
+            db.session.commit()
+        
+        seen = []
+        cursor = None
+        while True:
+            url = '/api/notifications?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            response = self.client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(n['reference_id'] for n in response.json['notifications'])
+            cursor = response.json['next_cursor']
+            if not cursor:
+                break
+        
+        self.assertEqual(seen, [4, 3, 2, 1, 0])
+        self.assertEqual(response.json['notifications'][0]['summary'], 'alice liked your post')
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected"""
+        response = self.client.get('/api/notifications?cursor=garbage', headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_digest_batches_users(self):
+        """Test that the digest builder covers every user once, in batches"""
+        with self.app.app_context():
+            for user_id in (self.owner_id, self.alice_id, self.bob_id):
+                notify(user_id, 'like', 1, actor_id=self.carol_id)
+            notify(self.owner_id, 'like', 1, actor_id=self.alice_id)
+            db.session.commit()
+            
+            digests = {}
+            delivered = build_digests(lambda user_id, digest: digests.setdefault(user_id, digest),
+                                      batch_size=2)
+            
+            self.assertEqual(delivered, 3)
+            self.assertEqual(digests[self.owner_id]['items'], ['alice and 1 other liked your post'])
+            self.assertEqual(digests[self.owner_id]['unread_count'], 1)
+            
+            # Nothing new, so nothing is delivered again
+            self.assertEqual(build_digests(lambda user_id, digest: None, batch_size=2), 0)
+
+    def test_unauthorized_access(self):
+        """Test accessing notification endpoints without authentication"""
+        response = self.client.get('/api/notifications')
+        self.assertEqual(response.status_code, 401)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,12 @@ import json
 import tempfile
 import os
 from io import BytesIO
+from unittest.mock import patch
 from PIL import Image
 from main import create_app
 from models.user import db, User
 from models.profile import Profile
+from api.cache import clear_response_cache
 
 class ProfileTestCase(unittest.TestCase):
     def setUp(self):
@@ -16,6 +18,7 @@ class ProfileTestCase(unittest.TestCase):
         self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
         self.app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp()
         self.client = self.app.test_client()
+        clear_response_cache()
         
         with self.app.app_context():
             db.create_all()
@@ -173,5 +176,108 @@ class ProfileTestCase(unittest.TestCase):
         self.assertIsInstance(data['profile']['education'], list)
         self.assertEqual(data['profile']['education'][0]['school'], 'Test University')
 
+    def test_get_profile_returns_etag(self):
+        """Test that profile reads carry a weak ETag once the profile exists"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        
+        response = self.client.get('/api/profile', headers=headers)
+        
+        self.assertEqual(response.status_code, 200)
+        etag, weak = response.get_etag()
+        self.assertTrue(weak)
+        self.assertIsNotNone(etag)
+
+    def test_get_profile_not_modified(self):
+        """Test that a matching If-None-Match returns 304 without a body"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        etag = self.client.get('/api/profile', headers=headers).headers['ETag']
+        
+        response = self.client.get('/api/profile',
+            headers={**headers, 'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_not_modified_skips_serialization(self):
+        """Test that a matching If-None-Match never serializes the profile"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        etag = self.client.get('/api/profile', headers=headers).headers['ETag']
+
+        with patch.object(Profile, 'to_dict', autospec=True, side_effect=Profile.to_dict) as to_dict:
+            response = self.client.get('/api/profile',
+                headers={**headers, 'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        to_dict.assert_not_called()
+
+    def test_repeated_get_served_from_cache(self):
+        """Test that a repeated read reuses the cached body for the same version"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)  # Creates the profile
+        first = self.client.get('/api/profile', headers=headers)
+
+        with patch.object(Profile, 'to_dict', autospec=True, side_effect=Profile.to_dict) as to_dict:
+            second = self.client.get('/api/profile', headers=headers)
+            to_dict.assert_not_called()
+
+            # A different query string is a different cache entry
+            self.client.get('/api/profile?fields=all', headers=headers)
+            self.assertEqual(to_dict.call_count, 1)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json, first.json)
+        self.assertEqual(second.headers['ETag'], first.headers['ETag'])
+
+    def test_update_profile_changes_etag(self):
+        """Test that updating the profile invalidates the previous ETag"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        etag = self.client.get('/api/profile', headers=headers).headers['ETag']
+        
+        self.client.put('/api/profile', json={'bio': 'Changed bio'}, headers=headers)
+        response = self.client.get('/api/profile',
+            headers={**headers, 'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.json['profile']['bio'], 'Changed bio')
+
+    def test_update_profile_increments_version(self):
+        """Test that each update bumps the committed profile version by one"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        
+        self.client.put('/api/profile', json={'bio': 'First'}, headers=headers)
+        response = self.client.put('/api/profile', json={'bio': 'Second'}, headers=headers)
+        
+        self.assertEqual(response.json['profile']['version'], 3)
+        get_response = self.client.get('/api/profile', headers=headers)
+        self.assertEqual(get_response.get_etag(), (f"profile-{get_response.json['user']['id']}-3", True))
+
+    def test_upload_image_changes_etag(self):
+        """Test that uploading a profile image invalidates the previous ETag"""
+        headers = {'Authorization': f'Bearer {self.token}'}
+        self.client.get('/api/profile', headers=headers)
+        etag = self.client.get('/api/profile', headers=headers).headers['ETag']
+        
+        img = Image.new('RGB', (100, 100), color='blue')
+        img_io = BytesIO()
+        img.save(img_io, 'JPEG')
+        img_io.seek(0)
+        self.client.post('/api/profile/image',
+            data={'image': (img_io, 'test.jpg')},
+            headers=headers,
+            content_type='multipart/form-data')
+        
+        response = self.client.get('/api/profile',
+            headers={**headers, 'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json['profile']['image_url'].startswith('/uploads/'))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,168 @@
+import unittest
+import os
+import tempfile
+from flask import Flask
+from flask_migrate import Migrate, upgrade, downgrade, stamp
+from alembic.migration import MigrationContext
+from alembic.autogenerate import compare_metadata
+from sqlalchemy import text, func, inspect
+from models.user import db
+from models.profile import Profile
+from models.post import Post, Comment, Like
+from models.job import Job, JobApplication
+from models.message import Message
+from models.notification import Notification
+from migrations.online import DROPPED_INDEXES_TABLE, include_object
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), 'migrations')
+
+# Indexes the original db.sql created that 0005_hot_path_indexes drops
+LEGACY_INDEXES = {
+    'idx_users_username': 'users(username)',
+    'idx_posts_user_id': 'posts(user_id)',
+    'idx_jobs_status': 'jobs(status)',
+}
+
+class SchemaTestCase(unittest.TestCase):
+    def setUp(self):
+        """Build a database from the migrations alone"""
+        self.db_fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{self.db_path}'
+        db.init_app(self.app)
+        Migrate(self.app, db, directory=MIGRATIONS_DIR)
+        
+        with self.app.app_context():
+            upgrade(directory=MIGRATIONS_DIR)
+
+    def tearDown(self):
+        """Clean up the database file"""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        os.close(self.db_fd)
+        os.remove(self.db_path)
+
+    def explain(self, query):
+        """Return the SQLite query plan for an ORM query as one string"""
+        sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+        rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')).fetchall()
+        return '\n'.join(row[-1] for row in rows)
+
+    def index_names(self):
+        """All index names in the database, across tables"""
+        inspector = inspect(db.engine)
+        return {ix['name'] for table in inspector.get_table_names() for ix in inspector.get_indexes(table)}
+
+    def test_migrations_match_models(self):
+        """Test that the migrated schema has no drift from the ORM models"""
+        with self.app.app_context():
+            with db.engine.connect() as connection:
+                context = MigrationContext.configure(connection, opts={'include_object': include_object})
+                diff = compare_metadata(context, db.metadata)
+        
+        self.assertEqual(diff, [])
+
+    def test_notification_migration_can_rerun(self):
+        """Test that re-running the notification revision after a partial upgrade succeeds"""
+        with self.app.app_context():
+            db.session.execute(text(
+                "INSERT INTO users (id, username, email, password_hash) VALUES (1, 'a', 'a@example.com', 'x')"))
+            # A second user past the first 1000-id chunk, so the seeds span chunks
+            db.session.execute(text(
+                "INSERT INTO users (id, username, email, password_hash) VALUES (1500, 'b', 'b@example.com', 'x')"))
+            for user_id, reference_id in [(1, 1), (1500, 1), (1500, 2)]:
+                db.session.execute(text(
+                    "INSERT INTO notifications (user_id, type, reference_id, actor_id, is_read, created_at) "
+                    f"VALUES ({user_id}, 'like', {reference_id}, 1, 0, CURRENT_TIMESTAMP)"))
+            db.session.commit()
+            
+            # The first re-run seeds the new row, the second must not duplicate it
+            for _ in range(2):
+                stamp(directory=MIGRATIONS_DIR, revision='0005_hot_path_indexes')
+                upgrade(directory=MIGRATIONS_DIR)
+            
+            counts = db.session.execute(text(
+                "SELECT user_id, unread_count FROM notification_counters ORDER BY user_id")).fetchall()
+            actors = db.session.execute(text("SELECT COUNT(*) FROM notification_actors")).scalar()
+        
+        self.assertEqual([tuple(row) for row in counts], [(1, 1), (1500, 2)])
+        self.assertEqual(actors, 3)
+
+    def test_index_downgrade_adds_nothing_new(self):
+        """Test that downgrading a migration-built database restores no db.sql indexes"""
+        with self.app.app_context():
+            downgrade(directory=MIGRATIONS_DIR, revision='0004_content_tables')
+            indexes = self.index_names()
+        
+        self.assertFalse(indexes & set(LEGACY_INDEXES))
+        self.assertNotIn('idx_posts_user_id_created_at', indexes)
+
+    def test_index_downgrade_restores_dropped_indexes(self):
+        """Test that a db.sql database gets back exactly the indexes the upgrade dropped"""
+        with self.app.app_context():
+            downgrade(directory=MIGRATIONS_DIR, revision='0004_content_tables')
+            for name, target in LEGACY_INDEXES.items():
+                db.session.execute(text(f'CREATE INDEX {name} ON {target}'))
+            db.session.commit()
+            
+            upgrade(directory=MIGRATIONS_DIR)
+            upgraded = self.index_names()
+            with db.engine.connect() as connection:
+                context = MigrationContext.configure(connection, opts={'include_object': include_object})
+                diff = compare_metadata(context, db.metadata)
+            
+            downgrade(directory=MIGRATIONS_DIR, revision='0004_content_tables')
+            restored = self.index_names()
+            tables = inspect(db.engine).get_table_names()
+        
+        self.assertFalse(upgraded & set(LEGACY_INDEXES))
+        self.assertEqual(diff, [])
+        self.assertEqual(restored & {'idx_users_username', 'idx_users_email', 'idx_posts_user_id',
+                                     'idx_jobs_status', 'idx_comments_post_id'}, set(LEGACY_INDEXES))
+        self.assertNotIn(DROPPED_INDEXES_TABLE, tables)
+
+    def test_hot_paths_use_indexes(self):
+        """Test that the hot access paths are served by the curated indexes"""
+        with self.app.app_context():
+            hot_paths = {
+                'idx_posts_user_id_created_at':
+                    Post.query.filter_by(user_id=1).order_by(Post.created_at.desc()),
+                'idx_posts_status_created_at':
+                    Post.query.filter_by(status='active').order_by(Post.created_at.desc()),
+                'idx_comments_post_id_created_at':
+                    Comment.query.filter_by(post_id=1).order_by(Comment.created_at),
+                'idx_likes_post_id_created_at':
+                    db.session.query(func.count(Like.id)).filter(Like.post_id == 1),
+                # SQLite backs UNIQUE constraints with an automatic index
+                'sqlite_autoindex_likes_1':
+                    Like.query.filter_by(user_id=1, post_id=1),
+                'idx_jobs_status_created_at':
+                    Job.query.filter_by(status='open').order_by(Job.created_at.desc()),
+                'idx_job_applications_job_id_status':
+                    JobApplication.query.filter_by(job_id=1, status='pending'),
+                'idx_job_applications_user_id_created_at':
+                    JobApplication.query.filter_by(user_id=1).order_by(JobApplication.created_at.desc()),
+                'idx_messages_sender_id_recipient_id_created_at':
+                    Message.query.filter_by(sender_id=1, recipient_id=2).order_by(Message.created_at),
+                'idx_messages_recipient_id_is_read_created_at':
+                    Message.query.filter_by(recipient_id=1, is_read=False),
+                'idx_notifications_user_id_type_reference_id_is_read':
+                    Notification.query.filter_by(user_id=1, type='like', reference_id=1, is_read=False),
+                'idx_notifications_user_id_updated_at_id':
+                    Notification.query.filter_by(user_id=1)
+                    .order_by(Notification.updated_at.desc(), Notification.id.desc()),
+                'idx_notifications_digested_at_user_id':
+                    db.session.query(Notification.user_id)
+                    .filter(Notification.digested_at.is_(None), Notification.user_id > 1)
+                    .distinct().order_by(Notification.user_id),
+            }
+            
+            for index_name, query in hot_paths.items():
+                with self.subTest(index=index_name):
+                    plan = self.explain(query)
+                    self.assertIn(f'INDEX {index_name}', plan)
+                    self.assertNotIn('TEMP B-TREE', plan)
+
+if __name__ == '__main__':
+    unittest.main()
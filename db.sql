@@ -83,6 +83,24 @@ CREATE TABLE users (
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Profiles Table
+CREATE TABLE profiles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER UNIQUE NOT NULL,
+    full_name TEXT NOT NULL,
+    bio TEXT,
+    location TEXT,
+    headline TEXT,
+    experience TEXT,
+    education TEXT,
+    skills TEXT,
+    website TEXT,
+    image_url TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
 -- Companies Table
 CREATE TABLE companies (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -195,22 +213,47 @@ CREATE TABLE notifications (
     user_id INTEGER NOT NULL,
     type TEXT NOT NULL CHECK (type IN ('connection', 'message', 'like', 'comment', 'job_application')),
     reference_id INTEGER NOT NULL,
+    actor_id INTEGER,
+    actor_count INTEGER NOT NULL DEFAULT 1,
     is_read BOOLEAN NOT NULL DEFAULT 0,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    digested_at TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+-- Notification Actors Table (distinct actors behind an aggregated notification)
+CREATE TABLE notification_actors (
+    notification_id INTEGER NOT NULL,
+    actor_id INTEGER NOT NULL,
+    PRIMARY KEY (notification_id, actor_id),
+    FOREIGN KEY (notification_id) REFERENCES notifications(id) ON DELETE CASCADE
+);
+
+-- Notification Counters Table (materialized unread count per user)
+CREATE TABLE notification_counters (
+    user_id INTEGER PRIMARY KEY,
+    unread_count INTEGER NOT NULL DEFAULT 0,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
--- Create indexes for frequently queried fields
-CREATE INDEX idx_users_username ON users(username);
-CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_posts_user_id ON posts(user_id);
-CREATE INDEX idx_posts_created_at ON posts(created_at);
-CREATE INDEX idx_comments_post_id ON comments(post_id);
-CREATE INDEX idx_likes_post_id ON likes(post_id);
-CREATE INDEX idx_jobs_company_id ON jobs(company_id);
-CREATE INDEX idx_jobs_status ON jobs(status);
-CREATE INDEX idx_messages_sender_recipient ON messages(sender_id, recipient_id);
-CREATE INDEX idx_notifications_user_id ON notifications(user_id);
+-- Create indexes for the hot access paths
+-- (kept in sync with the models' __table_args__ and app/backend/migrations)
+CREATE INDEX idx_posts_user_id_created_at ON posts(user_id, created_at);
+CREATE INDEX idx_posts_status_created_at ON posts(status, created_at);
+CREATE INDEX idx_comments_post_id_created_at ON comments(post_id, created_at);
+CREATE INDEX idx_comments_user_id ON comments(user_id);
+CREATE INDEX idx_likes_post_id_created_at ON likes(post_id, created_at);
+CREATE INDEX idx_companies_user_id ON companies(user_id);
+CREATE INDEX idx_jobs_status_created_at ON jobs(status, created_at);
+CREATE INDEX idx_jobs_company_id_status ON jobs(company_id, status);
+CREATE INDEX idx_job_applications_job_id_status ON job_applications(job_id, status);
+CREATE INDEX idx_job_applications_user_id_created_at ON job_applications(user_id, created_at);
+CREATE INDEX idx_messages_sender_id_recipient_id_created_at ON messages(sender_id, recipient_id, created_at);
+CREATE INDEX idx_messages_recipient_id_is_read_created_at ON messages(recipient_id, is_read, created_at);
+CREATE INDEX idx_notifications_user_id_type_reference_id_is_read ON notifications(user_id, type, reference_id, is_read);
+CREATE INDEX idx_notifications_user_id_updated_at_id ON notifications(user_id, updated_at, id);
+CREATE INDEX idx_notifications_digested_at_user_id ON notifications(digested_at, user_id);
 
 -- Create triggers for updated_at timestamps
 CREATE TRIGGER update_users_timestamp 